@@ -12,8 +12,12 @@ C = typing.TypeVar("C", bound=typing.Any)
 class TypedConfig:
     """
     Can be used instead of load_into.
+
+    Defines empty __slots__, so subclasses can use __slots__ to get rid of the per-instance __dict__.
     """
 
+    __slots__ = ()
+
     @classmethod
     def load(cls: typing.Type[C], data: T_data, key: str = None, init: dict[str, typing.Any] = None) -> C:
         """
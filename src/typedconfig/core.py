@@ -2,19 +2,19 @@
 Contains most of the loading logic.
 """
 
-import tomllib
+import copy
+import functools
+import inspect
 import types
 import typing
-import warnings
-from collections import ChainMap
 from dataclasses import is_dataclass
 from pathlib import Path
 
-from typeguard import TypeCheckError
+from typeguard import CollectionCheckStrategy, TypeCheckError
 from typeguard import check_type as _check_type
 
 from .errors import ConfigErrorInvalidType, ConfigErrorMissingKey
-from .helpers import camel_to_snake
+from .helpers import cached, cached_per_class, camel_to_snake
 
 # T is a reusable typevar
 T = typing.TypeVar("T")
@@ -37,9 +37,11 @@ def _data_for_nested_key(key: str, raw: dict[str, typing.Any]) -> dict[str, typi
         raw = {"some": {"nested": {"key": {"with": "data"}}}}
         -> {"with": "data"}
     """
-    parts = key.split(".")
-    while parts:
-        raw = raw[parts.pop(0)]
+    if "." not in key:
+        return typing.cast(dict[str, typing.Any], raw[key])
+
+    for part in key.split("."):
+        raw = raw[part]
 
     return raw
 
@@ -52,6 +54,31 @@ def _guess_key(clsname: str) -> str:
     return camel_to_snake(clsname)
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict[str, typing.Any]:  # noqa: ARG001
+    """
+    Parse a toml file, cached by path, modification time and size (so changes to the file are picked up).
+
+    The result is shared between calls, so it should not be mutated (see `_load_toml`).
+    """
+    # only imported when a file is actually loaded, since many users pass a dict:
+    import tomllib
+
+    # read the whole file at once and parse it in memory:
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _load_toml(path: Path) -> dict[str, typing.Any]:
+    """
+    Load a toml file, using the cached parse result if the file did not change.
+
+    The loaded (mutable) values end up on config instances, so a copy of the cached data is returned. \
+    Copying is still a lot faster than parsing the file again.
+    """
+    stat = path.stat()
+    return copy.deepcopy(_parse_toml(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
 def _load_data(data: T_data, key: str = None, classname: str = None) -> dict[str, typing.Any]:
     """
     Tries to load the right data from a filename/path or dict, based on a manual key or a classname.
@@ -63,8 +90,7 @@ def _load_data(data: T_data, key: str = None, classname: str = None) -> dict[str
         data = Path(data)
     if isinstance(data, Path):
         # todo: more than toml
-        with data.open("rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(data)
 
     if not data:
         return {}
@@ -72,7 +98,7 @@ def _load_data(data: T_data, key: str = None, classname: str = None) -> dict[str
     if key is None:
         # try to guess key by grabbing the first one or using the class name
         if len(data) == 1:
-            key = list(data.keys())[0]
+            key = next(iter(data))
         elif classname is not None:
             key = _guess_key(classname)
 
@@ -83,43 +109,81 @@ def _load_data(data: T_data, key: str = None, classname: str = None) -> dict[str
         return data
 
 
-def check_type(value: typing.Any, expected_type: T_typelike) -> bool:
+# typeguard also accepts these 'compatible' types, so the fast path should do the same:
+_COMPATIBLE_TYPES: dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+    bytes: (bytes, bytearray, memoryview),
+}
+
+Checker = typing.Callable[[typing.Any], bool]
+
+
+def _is_plain_class(_type: typing.Any) -> bool:
     """
-    Given a variable, check if it matches 'expected_type' (which can be a Union, parameterized generic etc.).
+    Returns whether _type is a regular class (e.g. no Protocol, Enum or typing special form), \
+    for which a simple isinstance check is enough.
+    """
+    return _type.__class__ is type
+
 
-    Based on typeguard but this returns a boolean instead of returning the value or throwing a TypeCheckError
+def _typeguard_checker(expected_type: typing.Any) -> Checker:
+    """
+    Slow path: let typeguard deal with any types the fast path does not understand.
     """
-    try:
-        _check_type(value, expected_type)
-        return True
-    except TypeCheckError:
-        return False
 
+    def checker(value: typing.Any) -> bool:
+        try:
+            # check every item (like the fast path does), not just the first one:
+            _check_type(value, expected_type, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS)
+            return True
+        except TypeCheckError:
+            return False
 
-def ensure_types(data: dict[str, T], annotations: dict[str, type]) -> dict[str, T | None]:
+    return checker
+
+
+@cached
+def _make_checker(expected_type: typing.Any) -> Checker:
     """
-    Make sure all values in 'data' are in line with the ones stored in 'annotations'.
+    Build a predicate that checks whether a value matches 'expected_type'.
 
-    If an annotated key in missing from data, it will be filled with None for convenience.
+    Common types (plain classes, list[T], dict[K, V] and unions of those) are checked with isinstance,
+    anything more exotic falls back to typeguard.
+    The result is cached, so this only has to be done once per (hashable) type.
     """
-    # custom object to use instead of None, since typing.Optional can be None!
-    # cast to T to make mypy happy
-    notfound = typing.cast(T, object())
+    if expected_type is typing.Any:
+        return lambda _: True
 
-    final: dict[str, T | None] = {}
-    for key, _type in annotations.items():
-        compare = data.get(key, notfound)
-        if compare is notfound:  # pragma: nocover
-            warnings.warn(
-                "This should not happen since " "`load_recursive` already fills `data` " "based on `annotations`"
-            )
-            # skip!
-            continue
-        if not check_type(compare, _type):
-            raise ConfigErrorInvalidType(key, value=compare, expected_type=_type)
+    origin = typing.get_origin(expected_type)
+    arguments = typing.get_args(expected_type)
+
+    if origin is None and _is_plain_class(expected_type):
+        instance_of = _COMPATIBLE_TYPES.get(expected_type, expected_type)
+        return lambda value: isinstance(value, instance_of)
+
+    if origin is list and len(arguments) == 1:
+        check_item = _make_checker(arguments[0])
+        return lambda value: isinstance(value, list) and all(map(check_item, value))
+
+    if origin is dict and len(arguments) == 2:  # key and value type
+        check_key, check_value = _make_checker(arguments[0]), _make_checker(arguments[1])
+        return lambda value: isinstance(value, dict) and all(check_key(k) and check_value(v) for k, v in value.items())
+
+    if origin in (typing.Union, types.UnionType):
+        if all(typing.get_origin(arg) is None and _is_plain_class(arg) for arg in arguments):
+            # e.g. str | None: one isinstance with a tuple of types
+            instance_of_any = tuple(t for arg in arguments for t in _COMPATIBLE_TYPES.get(arg, (arg,)))
+            return lambda value: isinstance(value, instance_of_any)
+
+        options = tuple(_make_checker(arg) for arg in arguments)
+        return lambda value: any(option(value) for option in options)
+
+    return _typeguard_checker(expected_type)
 
-        final[key] = compare
-    return final
+
+# used by `convert_config` to replace '-' and '.' with '_' in one go:
+_KEY_TRANS = str.maketrans("-.", "__")
 
 
 def convert_config(items: dict[str, T]) -> dict[str, T]:
@@ -128,14 +192,24 @@ def convert_config(items: dict[str, T]) -> dict[str, T]:
 
     1. removes any items where the value is None, since in that case the default should be used;
     2. replaces '-' and '.' in keys with '_' so it can be mapped to the Config properties.
+
+    If nothing has to change, `items` itself is returned (instead of a copy), so the result should not be mutated.
     """
-    return {k.replace("-", "_").replace(".", "_"): v for k, v in items.items() if v is not None}
+    for k, v in items.items():
+        if v is None or "-" in k or "." in k:
+            break
+    else:
+        # nothing to convert
+        return items
+
+    return {k.translate(_KEY_TRANS): v for k, v in items.items() if v is not None}
 
 
 Type = typing.Type[typing.Any]
 T_Type = typing.TypeVar("T_Type", bound=Type)
 
 
+@cached
 def is_builtin_type(_type: Type) -> bool:
     """
     Returns whether _type is one of the builtin types.
@@ -147,6 +221,7 @@ def is_builtin_type(_type: Type) -> bool:
 #     return is_builtin_type(obj.__class__)
 
 
+@cached
 def is_from_types_or_typing(_type: Type) -> bool:
     """
     Returns whether _type is one of the stlib typing/types types.
@@ -156,6 +231,7 @@ def is_from_types_or_typing(_type: Type) -> bool:
     return _type.__module__ in ("types", "typing")
 
 
+@cached
 def is_from_other_toml_supported_module(_type: Type) -> bool:
     """
     Besides builtins, toml also supports 'datetime' and 'math' types, \
@@ -164,6 +240,7 @@ def is_from_other_toml_supported_module(_type: Type) -> bool:
     return _type.__module__ in ("datetime", "math")
 
 
+@cached
 def is_parameterized(_type: Type) -> bool:
     """
     Returns whether _type is a parameterized type.
@@ -175,6 +252,7 @@ def is_parameterized(_type: Type) -> bool:
     return typing.get_origin(_type) is not None
 
 
+@cached
 def is_custom_class(_type: Type) -> bool:
     """
     Tries to guess if _type is a builtin or a custom (user-defined) class.
@@ -182,7 +260,7 @@ def is_custom_class(_type: Type) -> bool:
     Other logic in this module depends on knowing that.
     """
     return (
-        type(_type) is type
+        _type.__class__ is type
         and not is_builtin_type(_type)
         and not is_from_other_toml_supported_module(_type)
         and not is_from_types_or_typing(_type)
@@ -201,22 +279,206 @@ def is_optional(_type: Type | None) -> bool:
         list[str | None] -> False
         list[str] -> False
     """
-    return (
-        _type is None
-        or issubclass(types.NoneType, _type)
-        or issubclass(types.NoneType, type(_type))  # no type  # Nonetype
-        or type(None) in typing.get_args(_type)  # union with Nonetype
+    return _type is None or _is_optional(_type)
+
+
+@cached
+def _is_optional(_type: Type) -> bool:
+    """
+    Cached logic of `is_optional` for actual types.
+    """
+    if _type is types.NoneType or _type is object:
+        # None is always an instance of object
+        return True
+
+    # union with Nonetype:
+    return types.NoneType in typing.get_args(_type)
+
+
+# `defer(subtype, data, container, slot)` schedules loading `data` into an instance of `subtype`,
+# which will then be stored as container[slot]:
+Defer = typing.Callable[[Type, typing.Any, typing.Any, typing.Any], None]
+# a loader stores the (loaded) config value of a field (+ some extra info such as a subtype) into target[key]:
+Loader = typing.Callable[[dict[str, typing.Any], str, typing.Any, typing.Any, Defer], None]
+# key, annotated type, loader (None if the value can be used as-is), extra info for the loader, type checker
+FieldPlan = tuple[str, Type, Loader | None, typing.Any, Checker]
+
+
+def _load_custom(target: dict[str, typing.Any], key: str, value: typing.Any, subtype: Type, defer: Defer) -> None:
+    """
+    Load a custom class.
+    """
+    target[key] = None  # placeholder, to keep the order of the fields
+    defer(subtype, value, target, key)
+
+
+def _load_list_of(
+    target: dict[str, typing.Any], key: str, value: list[typing.Any], subtype: Type, defer: Defer
+) -> None:
+    """
+    Load a list of custom classes, e.g. list[Point].
+    """
+    target[key] = loaded = [None] * len(value)
+    for idx, subvalue in enumerate(value):
+        defer(subtype, subvalue, loaded, idx)
+
+
+def _load_dict_of(
+    target: dict[str, typing.Any], key: str, value: dict[str, typing.Any], subtype: Type, defer: Defer
+) -> None:
+    """
+    Load a dict of custom classes, e.g. dict[str, Point].
+
+    The keys are not a custom class, so don't try to convert them.
+    """
+    target[key] = loaded = dict.fromkeys(value)
+    for subkey, subvalue in value.items():
+        defer(subtype, subvalue, loaded, subkey)
+
+
+def _list_loader(arguments: tuple[typing.Any, ...]) -> tuple[Loader, typing.Any] | None:
+    """
+    e.g. list[Point].
+    """
+    if arguments and is_custom_class(arguments[0]):
+        return _load_list_of, arguments[0]
+    return None
+
+
+def _dict_loader(arguments: tuple[typing.Any, ...]) -> tuple[Loader, typing.Any] | None:
+    """
+    e.g. dict[str, Point].
+    """
+    if arguments and is_custom_class(arguments[1]):
+        return _load_dict_of, arguments[1]
+    return None
+
+
+def _union_loader(arguments: tuple[typing.Any, ...]) -> tuple[Loader, typing.Any] | None:
+    """
+    e.g. typing.Optional[Point] or Point | None: load into the (first) custom class of the union.
+    """
+    for arg in arguments:
+        if is_custom_class(arg):
+            return _load_custom, arg
+    return None
+
+
+# which loader to use for a parameterized type, based on its origin:
+_ORIGIN_LOADERS: dict[typing.Any, typing.Callable[[tuple[typing.Any, ...]], tuple[Loader, typing.Any] | None]] = {
+    list: _list_loader,
+    dict: _dict_loader,
+    typing.Union: _union_loader,
+    types.UnionType: _union_loader,
+}
+
+
+def _loader_for(_type: Type) -> tuple[Loader | None, typing.Any]:
+    """
+    Decide which loader (and with which extra info) should be used for a field with type _type.
+
+    Builtin types etc. don't need a loader, their config value can be used as-is.
+    """
+    if is_parameterized(_type):
+        origin_loader = _ORIGIN_LOADERS.get(typing.get_origin(_type))
+        if origin_loader and (loader := origin_loader(typing.get_args(_type))):
+            return loader
+
+        # todo: other parameterized types
+
+    elif is_custom_class(_type):
+        return _load_custom, _type
+
+    return None, None
+
+
+@cached_per_class
+def _plan_for(cls: Type) -> tuple[FieldPlan, ...]:
+    """
+    For every annotated field of cls, precompute how it should be loaded (see `_check_and_convert_data`).
+
+    This only depends on the class, so the dispatching only has to happen once per class.
+    NOTE: the annotations are read on the first load, later changes to them are not picked up!
+    """
+    return tuple(
+        (key, _type, *_loader_for(_type), _make_checker(_type)) for key, _type in _all_annotations_cached(cls).items()
     )
 
 
-def load_recursive(cls: Type, data: dict[str, T], annotations: dict[str, Type]) -> dict[str, T]:
+def _all_annotations(cls: Type) -> dict[str, Type]:
+    """
+    Returns a dictionary that includes annotations for all \
+    attributes defined in cls or inherited from superclasses.
+
+    The MRO is walked in reverse, so annotations of subclasses override those of their parents.
     """
-    For all annotations (recursively gathered from parents with `all_annotations`), \
-    try to resolve the tree of annotations.
+    merged: dict[str, Type] = {}
+    for c in reversed(getattr(cls, "__mro__", ())):
+        merged.update(inspect.get_annotations(c))
+    return merged
 
-    Uses `load_into_recurse`, not itself directly.
 
-    Example:
+@cached_per_class
+def _all_annotations_cached(cls: Type) -> dict[str, Type]:
+    """
+    Cached version of `_all_annotations`, only calculated once per class.
+
+    The returned dict is shared between calls, so it should not be mutated!
+    """
+    return _all_annotations(cls)
+
+
+@cached_per_class
+def _slot_names(cls: Type) -> tuple[str, ...]:
+    """
+    Returns all names in __slots__ of cls and its superclasses.
+    """
+    names: list[str] = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
+def _existing_attributes(inst: typing.Any) -> typing.Collection[str]:
+    """
+    Returns the names of attributes that were already set on inst (e.g. by __init__).
+
+    Works for regular classes (__dict__) and classes with __slots__.
+    """
+    if not (slots := _slot_names(inst.__class__)):
+        return typing.cast(typing.Collection[str], inst.__dict__.keys())
+
+    return {*getattr(inst, "__dict__", ()), *(name for name in slots if hasattr(inst, name))}
+
+
+def _set_attributes(inst: typing.Any, values: dict[str, typing.Any]) -> None:
+    """
+    Store 'values' on inst, using setattr if the class uses __slots__.
+    """
+    if _slot_names(inst.__class__):
+        for key, value in values.items():
+            setattr(inst, key, value)
+    else:
+        inst.__dict__.update(values)
+
+
+def _check_and_convert_data(
+    cls: Type,
+    data: dict[str, typing.Any],
+    _except: typing.Container[str],
+    defer: Defer,
+) -> tuple[dict[str, typing.Any], list[tuple[str, Type, Checker]]]:
+    """
+    Based on class annotations, this prepares the data for `_load_tree` in a single pass over the fields.
+
+    1. convert config-keys to python compatible config_keys
+    2. resolve every annotated field from the config, a default value or None (if optional); \
+        nested custom classes are passed to `defer`
+    3. ensures the annotated types match the actual types, \
+        except for fields containing nested classes: these are returned so they can be checked after loading.
+
+    Example (with `_load_tree` handling the nested classes):
         class First:
             key: str
 
@@ -238,94 +500,116 @@ def load_recursive(cls: Type, data: dict[str, T], annotations: dict[str, Type])
         annotations: {"key": str}
 
     """
-    updated = {}
-    for _key, _type in annotations.items():
-        if _key in data:
-            value: typing.Any = data[_key]  # value can change so define it as any instead of T
-            if is_parameterized(_type):
-                origin = typing.get_origin(_type)
-                arguments = typing.get_args(_type)
-                if origin is list and arguments and is_custom_class(arguments[0]):
-                    subtype = arguments[0]
-                    value = [load_into_recurse(subtype, subvalue) for subvalue in value]
-
-                elif origin is dict and arguments and is_custom_class(arguments[1]):
-                    # e.g. dict[str, Point]
-                    subkeytype, subvaluetype = arguments
-                    # subkey(type) is not a custom class, so don't try to convert it:
-                    value = {subkey: load_into_recurse(subvaluetype, subvalue) for subkey, subvalue in value.items()}
-                # elif origin is dict:
-                # keep data the same
-                elif origin is typing.Union and arguments:
-                    for arg in arguments:
-                        if is_custom_class(arg):
-                            value = load_into_recurse(arg, value)
-                        else:
-                            # print(_type, arg, value)
-                            ...
-
-                # todo: other parameterized/unions/typing.Optional
-
-            elif is_custom_class(_type):
-                # type must be C (custom class) at this point
-                value = load_into_recurse(
-                    # make mypy and pycharm happy by telling it _type is of type C...
-                    # actually just passing _type as first arg!
-                    typing.cast(Type_C[typing.Any], _type),
-                    value,
-                )
-
-        elif _key in cls.__dict__:
-            # property has default, use that instead.
-            value = cls.__dict__[_key]
+    data = convert_config(data)
+
+    to_load: dict[str, typing.Any] = {}
+    check_later = []
+    defaults = cls.__dict__
+    for key, _type, loader, extra, checker in _plan_for(cls):
+        if key in _except:
+            continue
+
+        if key in data:
+            value = data[key]
+            if loader is not None:
+                loader(to_load, key, value, extra, defer)
+                check_later.append((key, _type, checker))
+                continue
+        elif key in defaults and not isinstance(defaults[key], types.MemberDescriptorType):
+            # property has default (and is not just an empty slot), use that instead.
+            value = defaults[key]
         elif is_optional(_type):
             # type is optional and not found in __dict__ -> default is None
             value = None
         else:
-            # todo: exception group?
-            raise ConfigErrorMissingKey(_key, cls, _type)
+            raise ConfigErrorMissingKey(key, cls, _type)
 
-        updated[_key] = value
+        if not checker(value):
+            raise ConfigErrorInvalidType(key, value=value, expected_type=_type)
 
-    return updated
-
-
-def _all_annotations(cls: Type) -> ChainMap[str, Type]:
-    """
-    Returns a dictionary-like ChainMap that includes annotations for all \
-    attributes defined in cls or inherited from superclasses.
-    """
-    return ChainMap(*(c.__annotations__ for c in getattr(cls, "__mro__", []) if "__annotations__" in c.__dict__))
+        to_load[key] = value
 
+    return to_load, check_later
 
-def all_annotations(cls: Type, _except: typing.Iterable[str]) -> dict[str, Type]:
-    """
-    Wrapper around `_all_annotations` that filters away any keys in _except.
 
-    It also flattens the ChainMap to a regular dict.
-    """
-    _all = _all_annotations(cls)
-    return {k: v for k, v in _all.items() if k not in _except}
+# a nested class that still has to be loaded: class, data, init, existing instance and where to store the result
+_Job = tuple[Type, dict[str, typing.Any], dict[str, typing.Any] | None, typing.Any, typing.Any, typing.Any]
+# a class of which the data is prepared and can be instantiated once its nested classes are done:
+# class, prepared data, fields to type check afterwards, init, existing instance and where to store the result
+_Finish = tuple[
+    Type,
+    dict[str, typing.Any],
+    list[tuple[str, Type, Checker]],
+    dict[str, typing.Any],
+    typing.Any,
+    typing.Any,
+    typing.Any,
+]
 
 
-def _check_and_convert_data(
+def _load_tree(
     cls: typing.Type[C],
     data: dict[str, typing.Any],
-    _except: typing.Iterable[str],
-) -> dict[str, typing.Any]:
+    init: dict[str, typing.Any] = None,
+    inst: C = None,
+) -> C:
     """
-    Based on class annotations, this prepares the data for `load_into_recurse`.
+    Loads `data` into `cls` (or into the existing `inst`) including all nested custom classes, without recursion.
 
-    1. convert config-keys to python compatible config_keys
-    2. loads custom class type annotations with the same logic (see also `load_recursive`)
-    3. ensures the annotated types match the actual types after loading the config file.
+    Nested classes are collected depth-first using an explicit stack (see `_check_and_convert_data`).
+    Before its nested classes, a 'finish' task is pushed for every class, \
+    so it is instantiated after all of them (post-order) and siblings are handled in the order they were defined.
     """
-    annotations = all_annotations(cls, _except=_except)
+    result: list[typing.Any] = [None]
+    # (False, _Job) to prepare a class, (True, _Finish) to instantiate it:
+    stack: list[tuple[bool, typing.Any]] = [(False, (cls, data, init, inst, result, 0))]
+    children: list[_Job] = []
+
+    def defer(subtype: Type, subdata: typing.Any, container: typing.Any, slot: typing.Any) -> None:
+        children.append((subtype, subdata, None, None, container, slot))
+
+    # called for every nested class, local lookups are faster than globals:
+    check_dataclass = is_dataclass
+    prepare = _check_and_convert_data
 
-    to_load = convert_config(data)
-    to_load = load_recursive(cls, to_load, annotations)
-    to_load = ensure_types(to_load, annotations)
-    return to_load
+    while stack:
+        finish, task = stack.pop()
+        if finish:
+            _cls, to_load, check_later, init_kwargs, _inst, container, slot = typing.cast(_Finish, task)
+            # the nested classes are loaded now, so the remaining fields can be type checked:
+            for key, _type, checker in check_later:
+                if not checker(to_load[key]):
+                    raise ConfigErrorInvalidType(key, value=to_load[key], expected_type=_type)
+
+            if _inst is None:
+                to_load |= init_kwargs  # add extra init variables (should not happen for a dataclass but whatev)
+                _inst = _cls(**to_load)
+            else:
+                _set_attributes(_inst, to_load)
+
+            container[slot] = _inst
+            continue
+
+        _cls, _data, _init, _inst, container, slot = typing.cast(_Job, task)
+        if _init is None:
+            _init = {}
+
+        # fixme: cls.__init__ can set other keys than the name is in kwargs!!
+
+        if _inst is None and check_dataclass(_cls):
+            _except: typing.Container[str] = _init.keys()
+        else:
+            if _inst is None:
+                _inst = _cls(**_init)
+            _except = _existing_attributes(_inst)
+
+        to_load, check_later = prepare(_cls, _data, _except, defer)
+        stack.append((True, (_cls, to_load, check_later, _init, _inst, container, slot)))
+        # reversed so the nested classes are popped (and thus handled) in the order they were defined:
+        stack.extend((False, child) for child in reversed(children))
+        children.clear()
+
+    return typing.cast(C, result[0])
 
 
 def load_into_recurse(
@@ -336,27 +620,11 @@ def load_into_recurse(
     """
     Loads an instance of `cls` filled with `data`.
 
-    Uses `load_recursive` to load any fillable annotated properties (see that method for an example).
+    Uses `_check_and_convert_data` to load any fillable annotated properties (see that method for an example).
     `init` can be used to optionally pass extra __init__ arguments. \
         NOTE: This will overwrite a config key with the same name!
     """
-    if init is None:
-        init = {}
-
-    # fixme: cls.__init__ can set other keys than the name is in kwargs!!
-
-    if is_dataclass(cls):
-        to_load = _check_and_convert_data(cls, data, init.keys())
-        to_load |= init  # add extra init variables (should not happen for a dataclass but whatev)
-
-        # ensure mypy inst is an instance of the cls type (and not a fictuous `DataclassInstance`)
-        inst = typing.cast(C, cls(**to_load))
-    else:
-        inst = cls(**init)
-        to_load = _check_and_convert_data(cls, data, inst.__dict__.keys())
-        inst.__dict__.update(**to_load)
-
-    return inst
+    return _load_tree(cls, data, init=init)
 
 
 def load_into_existing(
@@ -373,16 +641,7 @@ def load_into_existing(
     if init is not None:
         raise ValueError("Can not init an existing instance!")
 
-    existing_data = inst.__dict__
-
-    annotations = all_annotations(cls, _except=existing_data.keys())
-    to_load = convert_config(data)
-    to_load = load_recursive(cls, to_load, annotations)
-    to_load = ensure_types(to_load, annotations)
-
-    inst.__dict__.update(**to_load)
-
-    return inst
+    return _load_tree(cls, data, inst=inst)
 
 
 def load_into_class(
@@ -430,6 +689,9 @@ def load_into(
         key: optional (nested) dictionary key to load data from (e.g. 'tool.su6.specific')
         init: optional data to pass to your cls' __init__ method (only if cls is not an instance already)
 
+    NOTE: how a class is loaded (based on its annotations) is determined once, on the first load. \
+        Changing the annotations of a class after that has no effect.
+
     """
     if not isinstance(cls, type):
         return load_into_instance(cls, data, key=key, init=init)
@@ -2,6 +2,12 @@
 Contains stand-alone helper functions.
 """
 
+import functools
+import typing
+import weakref
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
 
 def camel_to_snake(s: str) -> str:
     """
@@ -11,3 +17,43 @@ def camel_to_snake(s: str) -> str:
         https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case
     """
     return "".join([f"_{c.lower()}" if c.isupper() else c for c in s]).lstrip("_")
+
+
+def cached(func: F) -> F:
+    """
+    Bounded functools.lru_cache that keeps the signature of 'func' intact for mypy.
+
+    (types such as `type[Any]` are not seen as Hashable by mypy, even though they are)
+    Unhashable arguments (e.g. typing.Annotated with a dict) can not be cached, so 'func' is called directly for those.
+    """
+    cached_func = functools.lru_cache(maxsize=1024)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: typing.Any) -> typing.Any:
+        try:
+            return cached_func(*args)
+        except TypeError:
+            # unhashable argument (if 'func' itself raised the TypeError, it will simply raise it again)
+            return func(*args)
+
+    return typing.cast(F, wrapper)
+
+
+def cached_per_class(func: F) -> F:
+    """
+    Cache the result of 'func(cls)' for as long as cls exists.
+
+    The cache is keyed weakly, so classes created at runtime can still be garbage collected \
+    (unless the cached result itself refers to the class, e.g. a self-referencing annotation).
+    """
+    cache: weakref.WeakKeyDictionary[typing.Any, typing.Any] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def wrapper(cls: typing.Any) -> typing.Any:
+        try:
+            return cache[cls]
+        except KeyError:
+            result = cache[cls] = func(cls)
+            return result
+
+    return typing.cast(F, wrapper)
@@ -1,7 +1,9 @@
 import datetime as dt
+import gc
 import math
 import tomllib
 import typing
+import weakref
 from pathlib import Path
 from pprint import pprint
 
@@ -169,6 +171,21 @@ def test_missing_key():
     inst = typedconfig.load_into(OptionalRelevant, file, key="key")
     assert inst.key is None
 
+    with pytest.raises(ConfigErrorMissingKey):
+        # parameterized types are not optional either
+        typedconfig.load_into(Lists, file, key="key")
+
+
+class AnythingOrNothing:
+    anything: object
+    nothing: type(None)
+
+
+def test_missing_optional_key():
+    # both object and NoneType accept None, so missing keys default to None:
+    inst = typedconfig.load_into(AnythingOrNothing, {}, key="")
+    assert inst.anything is None and inst.nothing is None
+
 
 class Point:
     x: int
@@ -187,3 +204,149 @@ def test_dict_of_custom():
     for key, value in structure.contents.items():
         assert isinstance(key, str)
         assert isinstance(value, Point)
+
+
+class Counts:
+    contents: dict[str, int]
+
+
+def test_dict_of_builtin():
+    counts = typedconfig.load_into(Counts, {"counts": {"contents": {"apples": 3, "pears": 5}}})
+    assert counts.contents == {"apples": 3, "pears": 5}
+
+
+class NumberedStructure:
+    contents: dict[int, Point]
+
+
+def test_dict_of_custom_invalid_key():
+    data = {"numbered_structure": {"contents": {"first": {"x": 1, "y": 2}}}}
+
+    with pytest.raises(ConfigErrorInvalidType):
+        # the nested Points load fine, but the keys are not ints (checked after loading the Points)
+        typedconfig.load_into(NumberedStructure, data)
+
+
+class Lists:
+    numbers: list[int]
+
+
+class Sets:
+    # not handled by the fast path, but by typeguard:
+    numbers: set[int]
+
+
+def test_invalid_list_item():
+    assert typedconfig.load_into(Lists, {"lists": {"numbers": [1, 2, 3]}}).numbers == [1, 2, 3]
+
+    with pytest.raises(ConfigErrorInvalidType):
+        # every item is checked, not only the first one:
+        typedconfig.load_into(Lists, {"lists": {"numbers": [1, 2, "three"]}})
+
+    with pytest.raises(ConfigErrorInvalidType):
+        typedconfig.load_into(Sets, {"sets": {"numbers": {1, 2, "three"}}})
+
+
+def test_load_file_twice(tmp_path):
+    file = tmp_path / "lists.toml"
+    file.write_text("[lists]\nnumbers = [1, 2]\n")
+
+    first = typedconfig.load_into(Lists, file)
+    first.numbers.append(3)
+
+    # cached file contents should not be affected by changing a loaded config:
+    assert typedconfig.load_into(Lists, file).numbers == [1, 2]
+
+    # changes to the file should be picked up:
+    file.write_text("[lists]\nnumbers = [1, 2, 3, 4]\n")
+    assert typedconfig.load_into(Lists, file).numbers == [1, 2, 3, 4]
+
+
+class Node:
+    name: str
+
+
+# self-referencing annotation, added after the class exists:
+Node.__annotations__["child"] = typing.Optional[Node]
+
+
+def test_deeply_nested():
+    depth = 5000  # deeper than the default recursion limit
+    data: dict[str, typing.Any] = {"name": "leaf"}
+    for idx in range(depth):
+        data = {"name": f"node {idx}", "child": data}
+
+    node = typedconfig.load_into(Node, data, key="")
+    for _ in range(depth):
+        node = node.child
+
+    assert node.name == "leaf" and node.child is None
+
+
+class Keys:
+    dashed_key: str
+    dotted_key: str
+    with_default: str = "default"
+
+
+def test_key_conversion():
+    data = {"dashed-key": "dash", "dotted.key": "dot", "with_default": None}
+
+    keys = typedconfig.load_into(Keys, data, key="")
+    assert keys.dashed_key == "dash"
+    assert keys.dotted_key == "dot"
+    # None values are dropped, so the default is used:
+    assert keys.with_default == "default"
+
+
+class NewStyleOptional:
+    details: FruitDetails | None
+    no_details: FruitDetails | None
+
+
+def test_new_style_optional():
+    data = {"details": {"color": "yellow", "shape": "curved"}}
+
+    inst = typedconfig.load_into(NewStyleOptional, data, key="")
+    assert isinstance(inst.details, FruitDetails)
+    assert inst.details.color == "yellow"
+    assert inst.no_details is None
+
+
+class WithMetadata:
+    # unhashable metadata, so these types can not be cached:
+    number: typing.Annotated[int, {"meta": 1}]
+
+
+def test_unhashable_annotation():
+    inst = typedconfig.load_into(WithMetadata, {"with_metadata": {"number": 1}})
+    assert inst.number == 1
+
+    with pytest.raises(ConfigErrorInvalidType):
+        typedconfig.load_into(WithMetadata, {"with_metadata": {"number": "one"}})
+
+
+class Numbers:
+    ratio: float
+    mode: typing.Literal["fast", "slow"]
+
+
+def test_compatible_and_exotic_types():
+    # an int is also accepted for a float:
+    inst = typedconfig.load_into(Numbers, {"numbers": {"ratio": 1, "mode": "fast"}})
+    assert inst.ratio == 1 and inst.mode == "fast"
+
+    with pytest.raises(ConfigErrorInvalidType):
+        # Literal is checked by typeguard
+        typedconfig.load_into(Numbers, {"numbers": {"ratio": 1.5, "mode": "medium"}})
+
+
+def test_dynamic_classes_can_be_collected():
+    dynamic = type("Dynamic", (), {"__annotations__": {"number": int}})
+    assert typedconfig.load_into(dynamic, {"dynamic": {"number": 1}}).number == 1
+
+    ref = weakref.ref(dynamic)
+    del dynamic
+    gc.collect()
+    # the per-class caches should not keep the class alive:
+    assert ref() is None
@@ -115,3 +115,38 @@ def test_dataclasses():
     first = typedconfig.load_into(First, EXAMPLE_FILE, key="tool.first")
 
     assert tool.first.extra["name"]["first"] == first.extra["name"]["first"]
+
+
+# filled by Leaf.__post_init__ to check the order in which nested dataclasses are created:
+created: list[int] = []
+
+
+@dataclass
+class Leaf:
+    number: int
+
+    def __post_init__(self):
+        created.append(self.number)
+
+
+@dataclass
+class Branch:
+    first: Leaf
+    second: Leaf
+
+
+@dataclass
+class Root:
+    items: list[Leaf]
+    last: Leaf
+
+
+def test_nested_dataclass_order():
+    created.clear()
+    typedconfig.load_into(Branch, {"branch": {"first": {"number": 1}, "second": {"number": 2}}})
+    assert created == [1, 2]
+
+    created.clear()
+    root = typedconfig.load_into(Root, {"root": {"items": [{"number": n} for n in (1, 2, 3)], "last": {"number": 4}}})
+    assert created == [1, 2, 3, 4]
+    assert [leaf.number for leaf in root.items] == [1, 2, 3]
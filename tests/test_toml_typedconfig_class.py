@@ -108,3 +108,27 @@ def test_typedconfig_classes():
     first = First.load(EXAMPLE_FILE, key="tool.first")
 
     assert tool.first.extra["name"]["first"] == first.extra["name"]["first"]
+
+
+class Slotted(typedconfig.TypedConfig):
+    __slots__ = ("name", "number", "preset")
+
+    name: str
+    number: typing.Optional[int]
+    preset: str
+
+    def __init__(self, preset: str = "from init"):
+        self.preset = preset
+
+
+def test_slots():
+    slotted = Slotted.load({"slotted": {"name": "slots", "preset": "ignored"}})
+    assert not hasattr(slotted, "__dict__")
+    assert slotted.name == "slots"
+    assert slotted.number is None
+    # set by __init__, so not overwritten:
+    assert slotted.preset == "from init"
+
+    existing = Slotted("existing")
+    typedconfig.load_into(existing, {"slotted": {"name": "existing", "number": 3}})
+    assert existing.name == "existing" and existing.number == 3 and existing.preset == "existing"